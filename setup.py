@@ -0,0 +1,19 @@
+"""Package triadic_model; the optional Cython RHS (triadic_rhs) is built when a C compiler is available."""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Plain `python setup.py ...` without Cython: pure-Python install
+    ext_modules = []
+else:
+    ext_modules = cythonize('triadic_rhs.pyx')
+    for ext in ext_modules:
+        ext.optional = True  # No C compiler: warn and install without the extension
+
+setup(
+    name='triadic-fusion-model',
+    py_modules=['triadic_model'],
+    ext_modules=ext_modules,
+    install_requires=['numpy>=1.24.0', 'scipy>=1.10.0', 'matplotlib>=3.7.0', 'numba>=0.57.0'],
+    extras_require={'lsoda': ['numbalsoda']},
+)
@@ -0,0 +1,58 @@
+"""
+Consistency checks for the hand-written pieces that mirror `triadic_model`: the analytic
+Jacobian, the Hill lookup table and the optional Cython RHS.
+"""
+import numpy as np
+import pytest
+
+import triadic_model as tm
+
+PARAMS = np.array(tm.Params(0.8, 0.2, 3.0, 0.7, 0.3, nudge_time1=10.0, nudge_time2=25.0))
+TIMES = (5.0, 11.0, 26.0)  # Outside both nudge windows, inside the first, inside the second
+
+
+def _py(func):
+    """Plain-Python version of a compiled function (itself when Numba is not in use)."""
+    return getattr(func, 'py_func', func)
+
+
+def _states(n=20, seed=0):
+    # Stay away from the [0, 1] clamps, where the RHS is not differentiable
+    return np.random.default_rng(seed).uniform(0.05, 0.95, size=(n, 4))
+
+
+def test_jacobian_matches_finite_differences(monkeypatch):
+    # Differentiate the RHS with the closed-form Hill activation the Jacobian is derived from
+    monkeypatch.setattr(tm, 'hill_lookup', _py(tm.hill))
+    rhs = _py(tm.triadic_model)
+    eps = 1e-6
+    for y in _states():
+        for t in TIMES:
+            fd = np.empty((4, 4))
+            for j in range(4):
+                step = np.zeros(4)
+                step[j] = eps
+                fd[:, j] = (rhs(y + step, t, PARAMS) - rhs(y - step, t, PARAMS)) / (2 * eps)
+            np.testing.assert_allclose(tm.triadic_jac(y, t, PARAMS), fd, rtol=1e-6, atol=1e-6)
+
+
+def test_hill_derivative_matches_finite_differences():
+    x = np.linspace(0.01, 0.99, 99)
+    eps = 1e-6
+    fd = (_py(tm.hill)(x + eps) - _py(tm.hill)(x - eps)) / (2 * eps)
+    np.testing.assert_allclose(_py(tm.hill_derivative)(x), fd, rtol=1e-6, atol=1e-6)
+
+
+def test_hill_lookup_matches_hill():
+    x = np.linspace(0.0, 1.0, 10007)
+    looked_up = np.array([tm.hill_lookup(v) for v in x])
+    np.testing.assert_allclose(looked_up, tm.hill(x), rtol=0, atol=1e-5 * tm.HILL_GAMMA)
+
+
+def test_cython_rhs_matches_triadic_model():
+    triadic_rhs = pytest.importorskip('triadic_rhs')
+    out = np.empty(4)
+    for y in _states():
+        for t in TIMES:
+            triadic_rhs.rhs(t, y, out, PARAMS)
+            np.testing.assert_allclose(out, tm.triadic_model(y, t, PARAMS), rtol=0, atol=1e-4)
@@ -1,22 +1,109 @@
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from scipy.integrate import odeint
+import matplotlib
+if (sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+        and not os.environ.get('WAYLAND_DISPLAY') and 'MPLBACKEND' not in os.environ):
+    matplotlib.use('Agg')  # Headless Linux: skip GUI toolkit probing, render straight to file
 import matplotlib.pyplot as plt
 
-def hill(x, gamma=10.0, threshold=0.5, steepness=6):
+# Integration backend: 'odeint' (Numba RHS + analytic Jacobian), 'lsoda' (numbalsoda C
+# callback; opt-in, since importing numbalsoda JIT-compiles it for several seconds) or
+# 'cython' (prebuilt triadic_rhs extension; Numba is not imported at all)
+BACKEND = os.environ.get('TRIADIC_BACKEND', 'odeint')
+
+njit = None
+if BACKEND != 'cython':
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+if njit is None:
+    def njit(**options):
+        """Stand-in for numba.njit when Numba is skipped or missing: leaves functions as Python."""
+        return lambda func: func
+
+# Numba fast-math flags without 'ninf'/'nnan': nudge times use np.inf as the "no nudge"
+# sentinel, and comparisons against inf are undefined under 'ninf'
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+# Model parameters; field order matches the packed float array consumed by the compiled RHS.
+# A nudge time of np.inf means the nudge never fires.
+Params = namedtuple('Params', 'dwelling_rise dwelling_fade coupling_boost decay_relief '
+                              'base_decay nudge_time1 nudge_time2',
+                    defaults=(np.inf, np.inf))
+N_PARAMS = len(Params._fields)
+
+# Hill activation constants (steepness 6 is expanded into multiplies below)
+HILL_GAMMA = 10.0  # Maximum activation strength
+HILL_THRESHOLD = 0.5  # Inflection point for sigmoid-like response
+_THR6 = HILL_THRESHOLD**6
+
+@njit(cache=True, fastmath=FASTMATH)
+def hill(x):
     """
     Hill activation function for nonlinear mutual excitation.
     
+    gamma * x^6 / (threshold^6 + x^6), with gamma = HILL_GAMMA and threshold = HILL_THRESHOLD.
+    
     Parameters:
     - x: Input value (subsystem state, 0 to 1).
-    - gamma: Maximum activation strength.
-    - threshold: Inflection point for sigmoid-like response.
-    - steepness: Controls nonlinearity (higher = sharper transition).
     
     Returns: Activated value.
     """
-    return gamma * x**steepness / (threshold**steepness + x**steepness)
+    x2 = x * x
+    x6 = x2 * x2 * x2
+    return HILL_GAMMA * x6 / (_THR6 + x6)
 
-def triadic_model(y, t, params):
+@njit(cache=True, fastmath=FASTMATH)
+def hill_derivative(x):
+    """
+    Derivative of `hill` with respect to x.
+    
+    Returns: 6 * gamma * theta^6 * x^5 / (theta^6 + x^6)^2.
+    """
+    x2 = x * x
+    x4 = x2 * x2
+    denom = _THR6 + x4 * x2
+    return 6.0 * HILL_GAMMA * _THR6 * x4 * x / (denom * denom)
+
+# Length of each intervention window (time units)
+NUDGE_DURATION = 2.0
+
+@njit(cache=True, fastmath=FASTMATH)
+def nudge_window(t, nudge_time, duration=NUDGE_DURATION):
+    """
+    Branchless indicator of an intervention window.
+    
+    Returns: 1.0 for nudge_time <= t < nudge_time + duration, else 0.0 (always 0.0 for np.inf).
+    """
+    return 1.0 * ((nudge_time <= t) & (t < nudge_time + duration))
+
+# Hill activation tabulated on [0, 1] (the clamped state range) for interpolation in the RHS
+HILL_SAMPLES = 4096
+_HILL_TABLE = getattr(hill, 'py_func', hill)(np.linspace(0.0, 1.0, HILL_SAMPLES + 1))
+
+@njit(cache=True, fastmath=FASTMATH)
+def hill_lookup(x):
+    """
+    Hill activation by linear interpolation in the precomputed table.
+    
+    Parameters:
+    - x: Input value, must lie in [0, 1].
+    
+    Returns: Activated value, approximating `hill` (gamma = HILL_GAMMA, threshold = HILL_THRESHOLD).
+    """
+    s = x * HILL_SAMPLES
+    i = min(int(s), HILL_SAMPLES - 1)
+    f = s - i
+    return _HILL_TABLE[i] + f * (_HILL_TABLE[i + 1] - _HILL_TABLE[i])
+
+@njit(cache=True, fastmath=FASTMATH)
+def triadic_model(y, t, params, out=None):
     """
     Triadic ODE system with dwelling dynamics.
     
@@ -26,57 +113,233 @@ def triadic_model(y, t, params):
     - x3: GW-scale integration maturity (0-1).
     - dwelling: Incoherence-driven dwelling state (0-1).
     
-    Parameters (dict):
+    Parameters (Params, or float array in Params field order):
     - dwelling_rise: Rate of dwelling increase with incoherence.
     - dwelling_fade: Rate of dwelling decrease with coherence.
     - coupling_boost: Multiplier for coupling during high dwelling.
     - decay_relief: Reduction in decay during high dwelling.
     - base_decay: Baseline decay rate.
-    - nudge_time1, nudge_time2: Optional times for intervention nudges.
+    - nudge_time1, nudge_time2: Times for intervention nudges (np.inf = no nudge).
+    
+    out: Optional preallocated length-4 buffer that receives dy/dt (reused across calls).
     
-    Returns: dy/dt vector.
+    Returns: dy/dt vector (`out` when given).
     """
-    x1, x2, x3, dwelling = np.clip(y, 0.0, 1.0)
+    dwelling_rise, dwelling_fade, coupling_boost, decay_relief, base_decay, nudge_time1, nudge_time2 = params
+    # Scalar clamps: avoids allocating a clipped copy of y on every call
+    x1 = min(1.0, max(0.0, y[0]))
+    x2 = min(1.0, max(0.0, y[1]))
+    x3 = min(1.0, max(0.0, y[2]))
+    dwelling = min(1.0, max(0.0, y[3]))
     coherence = (x1 + x2 + x3) / 3.0
     
     # Dwelling dynamics: Accumulates in incoherence, dissipates in coherence
-    d_dwelling_dt = (params['dwelling_rise'] * (1 - coherence) * (1 - dwelling) - 
-                     params['dwelling_fade'] * coherence * dwelling)
+    d_dwelling_dt = (dwelling_rise * (1 - coherence) * (1 - dwelling) - 
+                     dwelling_fade * coherence * dwelling)
     
     # Adaptive modulation
-    coupling = 1.0 + params['coupling_boost'] * dwelling
-    decay = params['base_decay'] * (1.0 - params['decay_relief'] * dwelling)
+    coupling = 1.0 + coupling_boost * dwelling
+    decay = base_decay * (1.0 - decay_relief * dwelling)
     
     # Nonlinear activations
-    act1 = hill(x1)
-    act2 = hill(x2)
-    act3 = hill(x3)
+    act1 = hill_lookup(x1)
+    act2 = hill_lookup(x2)
+    act3 = hill_lookup(x3)
     
     # Triadic interactions: Each subsystem driven by average of others
     dx1_dt = coupling * (act2 + act3) / 2 * (1 - x1) - decay * x1
     dx2_dt = coupling * (act1 + act3) / 2 * (1 - x2) - decay * x2 * 1.2  # Slightly higher decay for x2
     dx3_dt = coupling * (act1 + act2) / 2 * (1 - x3) - decay * x3 * 1.5  # Higher decay for x3
     
-    # Phase-specific nudges (interventions)
-    if 'nudge_time1' in params and params['nudge_time1'] <= t < params['nudge_time1'] + 2:
-        dx1_dt += 0.5 * (1 - x1)  # Boost baseline tech
-    if 'nudge_time2' in params and params['nudge_time2'] <= t < params['nudge_time2'] + 2:
-        dx2_dt += 0.5 * (1 - x2)  # Boost quantum layer
+    # Phase-specific nudges (interventions), applied through window indicators so every
+    # scenario runs the same branch-free code path
+    dx1_dt += 0.5 * nudge_window(t, nudge_time1) * (1 - x1)  # Boost baseline tech
+    dx2_dt += 0.5 * nudge_window(t, nudge_time2) * (1 - x2)  # Boost quantum layer
+    
+    if out is None:
+        out = np.empty(4)
+    out[0] = dx1_dt
+    out[1] = dx2_dt
+    out[2] = dx3_dt
+    out[3] = d_dwelling_dt
+    return out
+
+@njit(cache=True, fastmath=FASTMATH)
+def triadic_jac(y, t, params):
+    """
+    Analytic Jacobian of `triadic_model` (row i holds the partials of dy_i/dt).
+    
+    Clamping of the state to [0, 1] is ignored; trajectories stay inside that range.
+    Supplied to odeint as `Dfun` so LSODA skips finite-difference Jacobian estimates.
+    
+    Returns: 4x4 Jacobian matrix.
+    """
+    dwelling_rise, dwelling_fade, coupling_boost, decay_relief, base_decay, nudge_time1, nudge_time2 = params
+    x1 = min(1.0, max(0.0, y[0]))
+    x2 = min(1.0, max(0.0, y[1]))
+    x3 = min(1.0, max(0.0, y[2]))
+    dwelling = min(1.0, max(0.0, y[3]))
+    coherence = (x1 + x2 + x3) / 3.0
+    
+    coupling = 1.0 + coupling_boost * dwelling
+    decay = base_decay * (1.0 - decay_relief * dwelling)
+    d_decay = -base_decay * decay_relief  # d(decay)/d(dwelling)
+    
+    act1, act2, act3 = hill(x1), hill(x2), hill(x3)
+    dact1, dact2, dact3 = hill_derivative(x1), hill_derivative(x2), hill_derivative(x3)
+    nudge1 = 0.5 * nudge_window(t, nudge_time1)
+    nudge2 = 0.5 * nudge_window(t, nudge_time2)
+    
+    J = np.zeros((4, 4))
+    # dx1/dt
+    J[0, 0] = -coupling * (act2 + act3) / 2 - decay - nudge1
+    J[0, 1] = coupling * dact2 / 2 * (1 - x1)
+    J[0, 2] = coupling * dact3 / 2 * (1 - x1)
+    J[0, 3] = coupling_boost * (act2 + act3) / 2 * (1 - x1) - d_decay * x1
+    # dx2/dt
+    J[1, 0] = coupling * dact1 / 2 * (1 - x2)
+    J[1, 1] = -coupling * (act1 + act3) / 2 - decay * 1.2 - nudge2
+    J[1, 2] = coupling * dact3 / 2 * (1 - x2)
+    J[1, 3] = coupling_boost * (act1 + act3) / 2 * (1 - x2) - d_decay * x2 * 1.2
+    # dx3/dt
+    J[2, 0] = coupling * dact1 / 2 * (1 - x3)
+    J[2, 1] = coupling * dact2 / 2 * (1 - x3)
+    J[2, 2] = -coupling * (act1 + act2) / 2 - decay * 1.5
+    J[2, 3] = coupling_boost * (act1 + act2) / 2 * (1 - x3) - d_decay * x3 * 1.5
+    # d(dwelling)/dt: coherence depends on each x_i with weight 1/3
+    d_coherence = (-dwelling_rise * (1 - dwelling) - dwelling_fade * dwelling) / 3.0
+    J[3, 0] = d_coherence
+    J[3, 1] = d_coherence
+    J[3, 2] = d_coherence
+    J[3, 3] = -dwelling_rise * (1 - coherence) - dwelling_fade * coherence
+    return J
+
+_LSODA = None
+
+def _lsoda_solver():
+    """
+    Import numbalsoda and compile the LSODA C callback on first use.
+    
+    Returns: (lsoda, callback address); the solver loop never re-enters Python per step.
+    """
+    global _LSODA
+    if _LSODA is None:
+        import numba as nb
+        from numbalsoda import lsoda, lsoda_sig
+        
+        @nb.cfunc(lsoda_sig)
+        def _lsoda_rhs(t, u, du, p):
+            # Write straight into LSODA's derivative array: no allocation or copy per call
+            triadic_model(nb.carray(u, (4,)), t, nb.carray(p, (N_PARAMS,)), nb.carray(du, (4,)))
+        
+        _LSODA = (lsoda, _lsoda_rhs.address)
+    return _LSODA
+
+# Scratch dy/dt buffer reused by odeint's RHS callbacks (odeint copies it out after each
+# call). Not thread-safe; worker processes each get their own copy on import.
+_DY = np.empty(4)
+
+# Solver tolerances: outputs are reported to 3 significant figures, so odeint's defaults
+# (~1.5e-8) are far tighter than needed and cost extra steps. Safe only because `simulate`
+# restarts the solver at every nudge window edge; otherwise LSODA can step over a window.
+RTOL = 1e-4
+ATOL = 1e-6
+
+def _nudge_edges(params, t):
+    """
+    Start and end times of the nudge windows that fall strictly inside the span of `t`.
+    
+    Returns: Sorted array of edge times (empty when no nudge fires).
+    """
+    nudge_times = np.array([params.nudge_time1, params.nudge_time2])
+    edges = np.concatenate((nudge_times, nudge_times + NUDGE_DURATION))
+    return np.unique(edges[(edges > t[0]) & (edges < t[-1])])
+
+def _integrate_piecewise(solve, y0, t, edges):
+    """
+    Integrate with a fresh solver start at each edge, like tstops/callbacks in other solvers.
+    
+    The RHS jumps at nudge window edges; a single adaptive run can step straight over a
+    window (and miss the nudge entirely), especially on sparse output grids.
+    
+    Parameters:
+    - solve: Callable (y0, t_segment) -> solution array (time x states).
+    - y0: Initial state.
+    - t: Output time grid.
+    - edges: Sorted discontinuity times strictly inside the span of `t`.
+    
+    Returns: Solution array (time x states) on `t`.
+    """
+    if len(edges) == 0:
+        return solve(y0, t)
+    grid = np.union1d(t, edges)
+    pieces = []
+    start = 0
+    for stop in np.searchsorted(grid, edges):
+        segment = solve(y0, grid[start:stop + 1])
+        pieces.append(segment[:-1])
+        y0 = segment[-1]
+        start = stop
+    pieces.append(solve(y0, grid[start:]))
+    return np.concatenate(pieces)[np.searchsorted(grid, t)]
+
+def simulate(params, y0, t, backend=None):
+    """
+    Integrate one scenario of the triadic system, restarting the solver at each nudge
+    window edge so no nudge is stepped over.
+    
+    Parameters:
+    - params: Params instance (see `triadic_model`).
+    - y0: Initial state [x1, x2, x3, dwelling].
+    - t: Output time grid.
+    - backend: 'odeint', 'lsoda' or 'cython' (defaults to BACKEND).
     
-    return [dx1_dt, dx2_dt, dx3_dt, d_dwelling_dt]
+    Returns: ODE solution array (states x time), one contiguous row per state.
+    """
+    params_arr = np.array(params, dtype=np.float64)
+    y0 = np.asarray(y0, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    backend = backend or BACKEND
+    if backend == 'odeint':
+        def solve(y_start, t_seg):
+            return odeint(triadic_model, y_start, t_seg, args=(params_arr, _DY),
+                          Dfun=lambda y, t, p, _: triadic_jac(y, t, p), col_deriv=False,
+                          rtol=RTOL, atol=ATOL)
+    elif backend == 'lsoda':
+        lsoda, rhs_address = _lsoda_solver()
+        
+        def solve(y_start, t_seg):
+            sol, success = lsoda(rhs_address, y_start, t_seg, data=params_arr,
+                                 rtol=RTOL, atol=ATOL)
+            if not success:
+                raise RuntimeError("LSODA integration failed")
+            return sol
+    elif backend == 'cython':
+        try:
+            import triadic_rhs
+        except ImportError as exc:
+            raise ImportError("Cython backend needs the triadic_rhs extension: "
+                              "run `python setup.py build_ext --inplace`") from exc
+        
+        def solve(y_start, t_seg):
+            return odeint(triadic_rhs.odeint_rhs, y_start, t_seg, args=(params_arr, _DY),
+                          rtol=RTOL, atol=ATOL)
+    else:
+        raise ValueError(f"Unknown integration backend: {backend!r}")
+    sol = _integrate_piecewise(solve, y0, t, _nudge_edges(Params(*params_arr), t))
+    # Transpose once to SoA layout so per-state downstream ops read contiguous memory
+    return np.ascontiguousarray(sol.T)
 
-def calculate_power_trajectory(sol, scenario='none'):
+def calculate_power_trajectory(x1, x2, x3, scenario='none'):
     """
     Compute emergent power output trajectory.
     
     Parameters:
-    - sol: ODE solution array (time x states).
+    - x1, x2, x3: Subsystem trajectories (contiguous 1-D arrays over time).
     - scenario: 'none', 'phase1', or 'both' for scaling mode.
     
     Returns: Power array (Watts) over time.
     """
-    x1, x2, x3 = sol[:, 0], sol[:, 1], sol[:, 2]
-    
     # Realistic parameters for compact fusion reactor (1 m³ volume)
     base_density = 10.0  # W/cm³ (adjusted for fusion power density)
     volume = 1e6  # cm³ (fridge-sized)
@@ -89,161 +352,251 @@ def calculate_power_trajectory(sol, scenario='none'):
         return base_density * volume * x1
     
     else:  # 'both' - Synergistic scaling
-        base_power = base_density * volume * x1
-        synergy = x2 * x3
-        quantum_factor = 1 + 99 * (synergy ** 2)  # Quadratic synergy for ~100x at full maturity
-        return base_power * quantum_factor
+        # base_density * volume * x1 * (1 + 99 * (x2 * x3)**2), evaluated in place in one buffer
+        power = np.multiply(x2, x3)
+        np.multiply(power, power, out=power)
+        power *= 99  # Quadratic synergy for ~100x at full maturity
+        power += 1
+        power *= x1
+        power *= base_density * volume
+        return power
+
+def run_scenarios(param_sets, y0, t, max_workers=1):
+    """
+    Integrate independent scenarios, serially or in a process pool.
+    
+    With the compiled RHS each scenario takes about a millisecond, far less than starting
+    worker processes, so the pool only pays off for large sweeps.
+    
+    Parameters:
+    - param_sets: Sequence of Params instances.
+    - y0: Initial state shared by all scenarios.
+    - t: Output time grid shared by all scenarios.
+    - max_workers: Worker process count; 1 (default) integrates serially in this process.
+    
+    Returns: List of ODE solution arrays (states x time), in the order of param_sets.
+    """
+    if max_workers <= 1:
+        return [simulate(p, y0, t) for p in param_sets]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(simulate, p, y0, t) for p in param_sets]
+        return [f.result() for f in futures]
+
+# Number of final timesteps averaged for the late-stage subsystem states
+LATE_WINDOW = 100
+
+def scenario_stats(S, late_window=LATE_WINDOW):
+    """
+    Coherence trajectories and late-stage subsystem averages for stacked scenarios.
+    
+    Parameters:
+    - S: Stacked solutions (scenarios x states x time).
+    - late_window: Number of final timesteps averaged for the late-stage states.
+    
+    Returns: (coherence, late_avg) with shapes (scenarios x time) and (scenarios x 3).
+    """
+    X = S[:, :3]
+    return X.mean(axis=1), X[:, :, -late_window:].mean(axis=2)
+
+# Non-interactive Matplotlib backends, for which plt.show() is a no-op
+_NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template')
+
+def _figure_curves(sols, cohs, powers):
+    """
+    Map line names to the y-data plotted by `make_figure`.
+    
+    Parameters:
+    - sols: (sol_no, sol_p1, sol_p2) solution arrays (states x time).
+    - cohs: (coh_no, coh_p1, coh_p2) coherence trajectories.
+    - powers: (power_p1, power_p2) power trajectories in Watts.
+    
+    Returns: Dict of line name -> y-data.
+    """
+    curves = {}
+    for tag, sol, coh in zip(('no', 'p1', 'p2'), sols, cohs):
+        curves[f'coh_{tag}'] = coh
+        curves[f'dwelling_{tag}'] = sol[3]
+        for i in range(3):
+            curves[f'x{i + 1}_{tag}'] = sol[i]
+    curves['power_p1'] = powers[0] / 1e6
+    curves['power_p2'] = powers[1] / 1e9
+    return curves
+
+def make_figure(t, sols, cohs, powers):
+    """
+    Build the 6-panel analysis figure.
+    
+    Parameters:
+    - t: Time grid.
+    - sols, cohs, powers: Scenario results (see `_figure_curves`).
+    
+    Returns: (fig, lines) where lines maps line names to Line2D objects for `update_figure`.
+    """
+    curves = _figure_curves(sols, cohs, powers)
+    lines = {}
+    fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(2, 3, figsize=(15, 10))
+
+    # Panel 1: Coherence
+    lines['coh_no'], = ax1.plot(t, curves['coh_no'], label='No Interventions', linewidth=2.5, color='#dc2626')
+    lines['coh_p1'], = ax1.plot(t, curves['coh_p1'], label='Phase 1 Only', linewidth=2.5, color='#f59e0b')
+    lines['coh_p2'], = ax1.plot(t, curves['coh_p2'], label='Phase 2 (Both)', linewidth=2.5, color='#10b981')
+    ax1.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
+    ax1.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
+    ax1.set_xlabel('Time (Scaled Months/Years)', fontsize=10)
+    ax1.set_ylabel('System Coherence', fontsize=10)
+    ax1.set_title('Progress to GW-Scale Systems', fontweight='bold')
+    ax1.legend(loc='best', fontsize=9)
+    ax1.grid(alpha=0.3)
+
+    # Panel 2: Dwelling
+    lines['dwelling_no'], = ax2.plot(t, curves['dwelling_no'], label='No Interventions', linewidth=2, color='#dc2626', alpha=0.7)
+    lines['dwelling_p1'], = ax2.plot(t, curves['dwelling_p1'], label='Phase 1', linewidth=2, color='#f59e0b', alpha=0.7)
+    lines['dwelling_p2'], = ax2.plot(t, curves['dwelling_p2'], label='Phase 2', linewidth=2, color='#10b981', alpha=0.7)
+    ax2.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
+    ax2.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
+    ax2.set_xlabel('Time', fontsize=10)
+    ax2.set_ylabel('Dwelling State', fontsize=10)
+    ax2.set_title('Incoherence-Driven Coupling', fontweight='bold')
+    ax2.legend(loc='best', fontsize=9)
+    ax2.grid(alpha=0.3)
+
+    # Panel 3: Power (Log)
+    lines['power_p1'], = ax3.semilogy(t, curves['power_p1'], label='Phase 1 (MW)', linewidth=2.5, color='#f59e0b')
+    lines['power_p2'], = ax3.semilogy(t, curves['power_p2'], label='Phase 2 (GW)', linewidth=2.5, color='#10b981')
+    ax3.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5, label='Phase 1 Nudge')
+    ax3.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5, label='Phase 2 Nudge')
+    ax3.set_xlabel('Time', fontsize=10)
+    ax3.set_ylabel('Power Output', fontsize=10)
+    ax3.set_title('Emergent Power Scaling (Log)', fontweight='bold')
+    ax3.legend(loc='best', fontsize=9)
+    ax3.grid(alpha=0.3, which='both')
+
+    # Panels 4-6: Subsystems
+    lines['x1_no'], = ax4.plot(t, curves['x1_no'], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
+    lines['x2_no'], = ax4.plot(t, curves['x2_no'], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
+    lines['x3_no'], = ax4.plot(t, curves['x3_no'], label='x3: GW Integration', linewidth=2, color='#ec4899')
+    ax4.set_xlabel('Time', fontsize=10)
+    ax4.set_ylabel('Subsystem State', fontsize=10)
+    ax4.set_title('No Intervention (Stuck)', fontweight='bold')
+    ax4.legend(loc='best', fontsize=8)
+    ax4.grid(alpha=0.3)
+
+    lines['x1_p1'], = ax5.plot(t, curves['x1_p1'], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
+    lines['x2_p1'], = ax5.plot(t, curves['x2_p1'], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
+    lines['x3_p1'], = ax5.plot(t, curves['x3_p1'], label='x3: GW Integration', linewidth=2, color='#ec4899')
+    ax5.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
+    ax5.set_xlabel('Time', fontsize=10)
+    ax5.set_ylabel('Subsystem State', fontsize=10)
+    ax5.set_title('Phase 1 Only (Partial)', fontweight='bold')
+    ax5.legend(loc='best', fontsize=8)
+    ax5.grid(alpha=0.3)
+
+    lines['x1_p2'], = ax6.plot(t, curves['x1_p2'], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
+    lines['x2_p2'], = ax6.plot(t, curves['x2_p2'], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
+    lines['x3_p2'], = ax6.plot(t, curves['x3_p2'], label='x3: GW Integration', linewidth=2, color='#ec4899')
+    ax6.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
+    ax6.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
+    ax6.set_xlabel('Time', fontsize=10)
+    ax6.set_ylabel('Subsystem State', fontsize=10)
+    ax6.set_title('Both Phases (Full Synergy)', fontweight='bold')
+    ax6.legend(loc='best', fontsize=8)
+    ax6.grid(alpha=0.3)
+
+    fig.tight_layout()
+    return fig, lines
+
+def update_figure(fig, lines, sols, cohs, powers):
+    """
+    Refresh an existing figure in place (e.g. across a parameter sweep) instead of re-plotting.
+    
+    Parameters:
+    - fig, lines: As returned by `make_figure`.
+    - sols, cohs, powers: New scenario results on the same time grid.
+    """
+    for name, ydata in _figure_curves(sols, cohs, powers).items():
+        lines[name].set_ydata(ydata)
+    for ax in fig.axes:
+        ax.relim()
+        ax.autoscale_view()
+    fig.canvas.draw_idle()
 
 # Default simulation parameters
-params = {
-    'dwelling_rise': 0.35,
-    'dwelling_fade': 0.45,
-    'coupling_boost': 0.8,
-    'decay_relief': 0.6,
-    'base_decay': 0.22
-}
+params = Params(
+    dwelling_rise=0.35,
+    dwelling_fade=0.45,
+    coupling_boost=0.8,
+    decay_relief=0.6,
+    base_decay=0.22
+)
 
 # Time and initial conditions
 t = np.linspace(0, 50, 500)  # Scaled time (e.g., months/years)
 y0 = [0.2, 0.1, 0.15, 0.6]   # [x1, x2, x3, dwelling]
 
-# Scenario simulations
-sol_no = odeint(triadic_model, y0, t, args=(params,))
-
-params_p1 = params.copy()
-params_p1['nudge_time1'] = 10
-sol_p1 = odeint(triadic_model, y0, t, args=(params_p1,))
-
-params_p2 = params_p1.copy()
-params_p2['nudge_time2'] = 25
-sol_p2 = odeint(triadic_model, y0, t, args=(params_p2,))
-
-# Coherence calculations
-coh_no = np.mean(sol_no[:, :3], axis=1)
-coh_p1 = np.mean(sol_p1[:, :3], axis=1)
-coh_p2 = np.mean(sol_p2[:, :3], axis=1)
-
-# Power trajectories
-power_no = calculate_power_trajectory(sol_no, 'none')
-power_p1 = calculate_power_trajectory(sol_p1, 'phase1')
-power_p2 = calculate_power_trajectory(sol_p2, 'both')
-
-# Visualization (6-panel figure)
-fig = plt.figure(figsize=(15, 10))
-
-# Panel 1: Coherence
-ax1 = plt.subplot(2, 3, 1)
-ax1.plot(t, coh_no, label='No Interventions', linewidth=2.5, color='#dc2626')
-ax1.plot(t, coh_p1, label='Phase 1 Only', linewidth=2.5, color='#f59e0b')
-ax1.plot(t, coh_p2, label='Phase 2 (Both)', linewidth=2.5, color='#10b981')
-ax1.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
-ax1.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
-ax1.set_xlabel('Time (Scaled Months/Years)', fontsize=10)
-ax1.set_ylabel('System Coherence', fontsize=10)
-ax1.set_title('Progress to GW-Scale Systems', fontweight='bold')
-ax1.legend(loc='best', fontsize=9)
-ax1.grid(alpha=0.3)
-
-# Panel 2: Dwelling
-ax2 = plt.subplot(2, 3, 2)
-ax2.plot(t, sol_no[:, 3], label='No Interventions', linewidth=2, color='#dc2626', alpha=0.7)
-ax2.plot(t, sol_p1[:, 3], label='Phase 1', linewidth=2, color='#f59e0b', alpha=0.7)
-ax2.plot(t, sol_p2[:, 3], label='Phase 2', linewidth=2, color='#10b981', alpha=0.7)
-ax2.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
-ax2.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
-ax2.set_xlabel('Time', fontsize=10)
-ax2.set_ylabel('Dwelling State', fontsize=10)
-ax2.set_title('Incoherence-Driven Coupling', fontweight='bold')
-ax2.legend(loc='best', fontsize=9)
-ax2.grid(alpha=0.3)
-
-# Panel 3: Power (Log)
-ax3 = plt.subplot(2, 3, 3)
-ax3.semilogy(t, power_p1 / 1e6, label='Phase 1 (MW)', linewidth=2.5, color='#f59e0b')
-ax3.semilogy(t, power_p2 / 1e9, label='Phase 2 (GW)', linewidth=2.5, color='#10b981')
-ax3.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5, label='Phase 1 Nudge')
-ax3.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5, label='Phase 2 Nudge')
-ax3.set_xlabel('Time', fontsize=10)
-ax3.set_ylabel('Power Output', fontsize=10)
-ax3.set_title('Emergent Power Scaling (Log)', fontweight='bold')
-ax3.legend(loc='best', fontsize=9)
-ax3.grid(alpha=0.3, which='both')
-
-# Panels 4-6: Subsystems
-ax4 = plt.subplot(2, 3, 4)
-ax4.plot(t, sol_no[:, 0], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
-ax4.plot(t, sol_no[:, 1], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
-ax4.plot(t, sol_no[:, 2], label='x3: GW Integration', linewidth=2, color='#ec4899')
-ax4.set_xlabel('Time', fontsize=10)
-ax4.set_ylabel('Subsystem State', fontsize=10)
-ax4.set_title('No Intervention (Stuck)', fontweight='bold')
-ax4.legend(loc='best', fontsize=8)
-ax4.grid(alpha=0.3)
-
-ax5 = plt.subplot(2, 3, 5)
-ax5.plot(t, sol_p1[:, 0], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
-ax5.plot(t, sol_p1[:, 1], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
-ax5.plot(t, sol_p1[:, 2], label='x3: GW Integration', linewidth=2, color='#ec4899')
-ax5.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
-ax5.set_xlabel('Time', fontsize=10)
-ax5.set_ylabel('Subsystem State', fontsize=10)
-ax5.set_title('Phase 1 Only (Partial)', fontweight='bold')
-ax5.legend(loc='best', fontsize=8)
-ax5.grid(alpha=0.3)
-
-ax6 = plt.subplot(2, 3, 6)
-ax6.plot(t, sol_p2[:, 0], label='x1: Baseline Tech', linewidth=2, color='#3b82f6')
-ax6.plot(t, sol_p2[:, 1], label='x2: Quantum Layer', linewidth=2, color='#8b5cf6')
-ax6.plot(t, sol_p2[:, 2], label='x3: GW Integration', linewidth=2, color='#ec4899')
-ax6.axvline(10, color='gold', ls='--', alpha=0.5, linewidth=1.5)
-ax6.axvline(25, color='darkred', ls='--', alpha=0.5, linewidth=1.5)
-ax6.set_xlabel('Time', fontsize=10)
-ax6.set_ylabel('Subsystem State', fontsize=10)
-ax6.set_title('Both Phases (Full Synergy)', fontweight='bold')
-ax6.legend(loc='best', fontsize=8)
-ax6.grid(alpha=0.3)
-
-plt.tight_layout()
-fig.savefig('triadic_gw_analysis.png', dpi=300, bbox_inches='tight')
-print("Figure saved as 'triadic_gw_analysis.png'")
-plt.show()  # Optional: Display in interactive environments
-
-# Analysis and printing
-final_power_no = power_no[-1]
-final_power_p1 = power_p1[-1]
-final_power_p2 = power_p2[-1]
-
-late_avg_no = np.mean(sol_no[-100:, :3], axis=0)
-late_avg_p1 = np.mean(sol_p1[-100:, :3], axis=0)
-late_avg_p2 = np.mean(sol_p2[-100:, :3], axis=0)
-
-print("\n" + "="*70)
-print("TRIADIC PHASE MODEL - GW-SCALE ANALYSIS")
-print("="*70)
-
-print("\n--- FINAL POWER OUTPUTS ---")
-print(f"No Interventions:  {final_power_no:.3f} W (stuck at {coh_no[-1]:.1%} coherence)")
-print(f"Phase 1 Only:      {final_power_p1/1e6:.3f} MW ({coh_p1[-1]:.1%} coherence)")
-print(f"Both Phases:       {final_power_p2/1e9:.3f} GW ({coh_p2[-1]:.1%} coherence)")
-
-print("\n--- LATE-STAGE SUBSYSTEM STATES (last 100 timesteps) ---")
-print(f"No Intervention:   x1={late_avg_no[0]:.3f}, x2={late_avg_no[1]:.3f}, x3={late_avg_no[2]:.3f}")
-print(f"Phase 1 Only:      x1={late_avg_p1[0]:.3f}, x2={late_avg_p1[1]:.3f}, x3={late_avg_p1[2]:.3f}")
-print(f"Both Phases:       x1={late_avg_p2[0]:.3f}, x2={late_avg_p2[1]:.3f}, x3={late_avg_p2[2]:.3f}")
-
-print("\n--- KEY INSIGHTS ---")
-print(f"• Phase 1 achieves {final_power_p1/1e6:.1f} MW through baseline technology")
-print(f"• Phase 2 achieves {final_power_p2/final_power_p1:.0f}x boost via quantum synergy")
-print(f"• Quantum-GW synergy (x2*x3): {late_avg_p2[1]*late_avg_p2[2]:.3f}")
-print(f"• Without intervention, system remains at {coh_no[-1]:.1%} coherence (dwelling trap)")
-
-print("\n--- POWER SCALING MECHANISM ---")
-print(f"• Base density: 10 W/cm³ (compact fusion scale)")
-print(f"• System volume: 1 m³ (fridge-sized)")
-print(f"• Phase 1: Linear scaling with x1 → {final_power_p1/1e6:.2f} MW")
-print(f"• Phase 2: Exponential synergy (x2×x3)² → {final_power_p2/1e9:.2f} GW")
-
-print("="*70 + "\n")
+# Set False for analysis-only runs: skips the figure and outputs only the late-stage window
+PLOT = True
+
+def main():
+    """Simulate the three scenarios, save the 6-panel figure, and print the analysis."""
+    # Scenario simulations
+    params_p1 = params._replace(nudge_time1=10)
+    params_p2 = params_p1._replace(nudge_time2=25)
+    # The printed analysis only reads the final LATE_WINDOW samples; t[0] is kept as the
+    # integrators' initial time. The sparse grid leaves the solver free to take long steps,
+    # which is safe only because `simulate` restarts it at every nudge window edge.
+    t_out = t if PLOT else np.concatenate((t[:1], t[-LATE_WINDOW:]))
+    S = np.stack(run_scenarios([params, params_p1, params_p2], y0, t_out))
+    sol_no, sol_p1, sol_p2 = S
+
+    # Coherence and late-stage averages for all scenarios at once
+    coh, late_avg = scenario_stats(S)
+    coh_no, coh_p1, coh_p2 = coh
+    late_avg_no, late_avg_p1, late_avg_p2 = late_avg
+
+    # Power trajectories (the no-intervention scenario produces no power, so none is computed)
+    power_p1 = calculate_power_trajectory(*sol_p1[:3], 'phase1')
+    power_p2 = calculate_power_trajectory(*sol_p2[:3], 'both')
+
+    # Visualization (6-panel figure)
+    if PLOT:
+        fig, _ = make_figure(t, (sol_no, sol_p1, sol_p2), (coh_no, coh_p1, coh_p2), (power_p1, power_p2))
+        fig.savefig('triadic_gw_analysis.png', dpi=150, bbox_inches='tight', pil_kwargs={'optimize': True})
+        print("Figure saved as 'triadic_gw_analysis.png'")
+        if plt.get_backend().lower() not in _NON_INTERACTIVE_BACKENDS:
+            plt.show()  # Display only when an interactive backend is active
+
+    # Analysis and printing
+    final_power_no = 0.0  # No power scaling without interventions
+    final_power_p1 = power_p1[-1]
+    final_power_p2 = power_p2[-1]
+
+    print("\n" + "="*70)
+    print("TRIADIC PHASE MODEL - GW-SCALE ANALYSIS")
+    print("="*70)
+
+    print("\n--- FINAL POWER OUTPUTS ---")
+    print(f"No Interventions:  {final_power_no:.3f} W (stuck at {coh_no[-1]:.1%} coherence)")
+    print(f"Phase 1 Only:      {final_power_p1/1e6:.3f} MW ({coh_p1[-1]:.1%} coherence)")
+    print(f"Both Phases:       {final_power_p2/1e9:.3f} GW ({coh_p2[-1]:.1%} coherence)")
+
+    print("\n--- LATE-STAGE SUBSYSTEM STATES (last 100 timesteps) ---")
+    print(f"No Intervention:   x1={late_avg_no[0]:.3f}, x2={late_avg_no[1]:.3f}, x3={late_avg_no[2]:.3f}")
+    print(f"Phase 1 Only:      x1={late_avg_p1[0]:.3f}, x2={late_avg_p1[1]:.3f}, x3={late_avg_p1[2]:.3f}")
+    print(f"Both Phases:       x1={late_avg_p2[0]:.3f}, x2={late_avg_p2[1]:.3f}, x3={late_avg_p2[2]:.3f}")
+
+    print("\n--- KEY INSIGHTS ---")
+    print(f"• Phase 1 achieves {final_power_p1/1e6:.1f} MW through baseline technology")
+    print(f"• Phase 2 achieves {final_power_p2/final_power_p1:.0f}x boost via quantum synergy")
+    print(f"• Quantum-GW synergy (x2*x3): {late_avg_p2[1]*late_avg_p2[2]:.3f}")
+    print(f"• Without intervention, system remains at {coh_no[-1]:.1%} coherence (dwelling trap)")
+
+    print("\n--- POWER SCALING MECHANISM ---")
+    print(f"• Base density: 10 W/cm³ (compact fusion scale)")
+    print(f"• System volume: 1 m³ (fridge-sized)")
+    print(f"• Phase 1: Linear scaling with x1 → {final_power_p1/1e6:.2f} MW")
+    print(f"• Phase 2: Exponential synergy (x2×x3)² → {final_power_p2/1e9:.2f} GW")
+
+    print("="*70 + "\n")
 
 if __name__ == "__main__":
-    pass  # Script runs on import/execution
+    main()
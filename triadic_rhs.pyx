@@ -0,0 +1,68 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Ahead-of-time compiled triadic RHS, an alternative to the Numba JIT in triadic_model.py.
+
+Mirrors `triadic_model.triadic_model` (closed-form Hill activation instead of the
+lookup table). Build once with `python setup.py build_ext --inplace`, then
+select it with TRIADIC_BACKEND=cython.
+"""
+
+cdef double HILL_GAMMA = 10.0
+cdef double THR6 = 0.5**6  # threshold**steepness
+
+cdef inline double _clamp01(double x) noexcept nogil:
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+cdef inline double _hill(double x) noexcept nogil:
+    cdef double x2 = x * x
+    cdef double x6 = x2 * x2 * x2
+    return HILL_GAMMA * x6 / (THR6 + x6)
+
+cdef inline double _nudge_window(double t, double nudge_time) noexcept nogil:
+    return 1.0 if (nudge_time <= t) & (t < nudge_time + 2.0) else 0.0
+
+cpdef void rhs(double t, const double[::1] y, double[::1] out, const double[::1] p) noexcept nogil:
+    """
+    Triadic ODE system with dwelling dynamics, written into `out`.
+
+    Parameters:
+    - t: Time.
+    - y: State [x1, x2, x3, dwelling].
+    - out: Length-4 buffer receiving dy/dt.
+    - p: Parameters in triadic_model.Params field order (np.inf = no nudge).
+    """
+    cdef double x1 = _clamp01(y[0])
+    cdef double x2 = _clamp01(y[1])
+    cdef double x3 = _clamp01(y[2])
+    cdef double dwelling = _clamp01(y[3])
+    cdef double coherence = (x1 + x2 + x3) / 3.0
+
+    # Dwelling dynamics: Accumulates in incoherence, dissipates in coherence
+    cdef double d_dwelling_dt = (p[0] * (1 - coherence) * (1 - dwelling) -
+                                 p[1] * coherence * dwelling)
+
+    # Adaptive modulation
+    cdef double coupling = 1.0 + p[2] * dwelling
+    cdef double decay = p[4] * (1.0 - p[3] * dwelling)
+
+    # Nonlinear activations
+    cdef double act1 = _hill(x1)
+    cdef double act2 = _hill(x2)
+    cdef double act3 = _hill(x3)
+
+    # Triadic interactions plus phase-specific nudges
+    out[0] = (coupling * (act2 + act3) / 2 * (1 - x1) - decay * x1
+              + 0.5 * _nudge_window(t, p[5]) * (1 - x1))
+    out[1] = (coupling * (act1 + act3) / 2 * (1 - x2) - decay * x2 * 1.2
+              + 0.5 * _nudge_window(t, p[6]) * (1 - x2))
+    out[2] = coupling * (act1 + act2) / 2 * (1 - x3) - decay * x3 * 1.5
+    out[3] = d_dwelling_dt
+
+def odeint_rhs(y, double t, p, out):
+    """
+    `rhs` with odeint's calling convention: odeint(odeint_rhs, y0, t, args=(params_arr, buf)).
+
+    Returns: `out`, filled with dy/dt.
+    """
+    rhs(t, y, out, p)
+    return out